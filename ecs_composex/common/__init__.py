@@ -15,14 +15,48 @@ if TYPE_CHECKING:
 
 import re
 from datetime import datetime as dt
-from math import ceil, log
+from functools import lru_cache
+from math import ceil
 from uuid import uuid4
 
-DATE = dt.utcnow().isoformat()
-FILE_PREFIX = f'{dt.utcnow().strftime("%Y/%m/%d/%H%M")}/{str(uuid4().hex)[:6]}'
 NONALPHANUM = re.compile(r"([^a-zA-Z\d]+)")
 
 
+@lru_cache(maxsize=4096)
+def alnum(value: str) -> str:
+    """
+    :returns: the value with all non-alphanumeric characters removed, i.e. usable as a CFN logical name.
+    """
+    return NONALPHANUM.sub("", value)
+
+
+@lru_cache(maxsize=1)
+def get_run_date() -> str:
+    """
+    :returns: the ISO formatted date of the first call, used as the templates generation date.
+    """
+    return dt.utcnow().isoformat()
+
+
+@lru_cache(maxsize=1)
+def get_file_prefix() -> str:
+    """
+    :returns: the S3 key prefix for the files uploaded during this execution, set on first call.
+    """
+    return f'{dt.utcnow().strftime("%Y/%m/%d/%H%M")}/{str(uuid4().hex)[:6]}'
+
+
+def __getattr__(name: str):
+    """
+    Keeps DATE and FILE_PREFIX importable without evaluating them at import time.
+    """
+    if name == "DATE":
+        return get_run_date()
+    elif name == "FILE_PREFIX":
+        return get_file_prefix()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def clpow2(x):
     """
     Function to return the closest power of two from given x
@@ -31,7 +65,13 @@ def clpow2(x):
 
     :returns: int() closest power of two
     """
-    return pow(2, int(log(x, 2) + 0.5))
+    if x < 1:
+        return 1
+    floor_pow2 = 1 << (int(x).bit_length() - 1)
+    # Closest in log2 scale: round up once x >= floor_pow2 * sqrt(2)
+    if x * x >= 2 * floor_pow2 * floor_pow2:
+        return floor_pow2 << 1
+    return floor_pow2
 
 
 def nxtpow2(x):
@@ -41,7 +81,9 @@ def nxtpow2(x):
 
     :returns: next power of two number
     """
-    return int(pow(2, ceil(log(x, 2))))
+    if x <= 1:
+        return 1
+    return 1 << (ceil(x) - 1).bit_length()
 
 
 def get_nested_property(
@@ -9,9 +9,14 @@ import secrets
 from copy import deepcopy
 from string import ascii_lowercase
 from time import sleep
+from weakref import WeakKeyDictionary
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws import get_assume_role_session, validate_iam_role_arn
+from compose_x_common.aws import (
+    get_account_id,
+    get_assume_role_session,
+    validate_iam_role_arn,
+)
 from compose_x_common.aws.arns import ARNS_PER_TAGGINGAPI_TYPE
 from compose_x_common.compose_x_common import keyisset
 from tabulate import tabulate
@@ -19,6 +24,22 @@ from tabulate import tabulate
 from ecs_composex.common.logging import LOG
 from ecs_composex.iam import ROLE_ARN_ARG
 
+SESSIONS_ACCOUNT_ID = WeakKeyDictionary()
+
+
+def get_session_account_id(session) -> str:
+    """
+    Returns the account ID of the session, calling STS only once per session.
+
+    :param boto3.session.Session session:
+    :rtype: str
+    """
+    if session is None:
+        return get_account_id()
+    if session not in SESSIONS_ACCOUNT_ID:
+        SESSIONS_ACCOUNT_ID[session] = get_account_id(session)
+    return SESSIONS_ACCOUNT_ID[session]
+
 
 def get_cross_role_session(session, arn, region_name=None, session_name=None):
     """
@@ -5,6 +5,8 @@
 Functions to manage a template and wheter it should be stored in S3
 """
 import pprint
+from copy import deepcopy
+from functools import lru_cache
 from os.path import abspath
 
 import yaml
@@ -12,22 +14,55 @@ from retry import retry
 
 try:
     from yaml import CDumper as Dumper
+    from yaml import CSafeLoader as SafeLoader
+
+    HAS_LIBYAML = True
 except ImportError:
-    from yaml import Dumper
+    from yaml import Dumper, SafeLoader
+
+    HAS_LIBYAML = False
 
 import json
-from os import makedirs
+from os import makedirs, stat
 
 from botocore.exceptions import ClientError
 from troposphere import Template
 
-from ecs_composex.common import FILE_PREFIX
+from ecs_composex.common import get_file_prefix
 from ecs_composex.common.logging import LOG
 
 JSON_MIME = "application/json"
 YAML_MIME = "application/x-yaml"
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_file(file_path: str, mtime_ns: int, size: int):
+    """
+    Parses the YAML file. The modification time and size are only used as cache keys, so that a file that
+    changed gets parsed again.
+    """
+    if not HAS_LIBYAML:
+        LOG.warning(
+            f"{file_path} - libyaml is not available, parsing with the pure python YAML loader."
+        )
+    with open(file_path) as yaml_fd:
+        return yaml.load(yaml_fd, Loader=SafeLoader)
+
+
+def load_yaml_file(file_path: str):
+    """
+    Loads the content of a YAML file. Files are only parsed once for as long as they remain unchanged.
+
+    :param str file_path: path to the YAML file
+    :return: a copy of the parsed content, which the caller can safely modify
+    """
+    file_path = abspath(file_path)
+    file_stat = stat(file_path)
+    return deepcopy(
+        _load_yaml_file(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+    )
+
+
 def upload_file(
     body,
     bucket_name,
@@ -52,7 +87,7 @@ def upload_file(
     if mime is None:
         mime = JSON_MIME
     if prefix is None:
-        prefix = FILE_PREFIX
+        prefix = get_file_prefix()
 
     key = f"{prefix}/{file_name}"
     client = settings.session.client("s3")
@@ -13,12 +13,17 @@ class MyFormatter(logthings.Formatter):
     debug_format = "%(asctime)s [%(levelname)8s] (%(filename)s.%(lineno)d , %(funcName)s,) %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._default_formatter = logthings.Formatter(
+            self.default_format, self.date_format
+        )
+        self._debug_formatter = logthings.Formatter(self.debug_format, self.date_format)
+
     def format(self, record) -> str:
         if record.levelno == logthings.DEBUG:
-            formatter = logthings.Formatter(self.debug_format, self.date_format)
-        else:
-            formatter = logthings.Formatter(self.default_format, self.date_format)
-        return formatter.format(record)
+            return self._debug_formatter.format(record)
+        return self._default_formatter.format(record)
 
 
 class InfoFilter(logthings.Filter):
@@ -38,21 +43,22 @@ class ErrorFilter(logthings.Filter):
 def setup_logging():
     """ """
     root_logger = logthings.getLogger()
-    for h in root_logger.handlers:
+    for h in root_logger.handlers[:]:
         root_logger.removeHandler(h)
 
     app_logger = logthings.getLogger("ecs-compose-x")
 
-    for h in app_logger.handlers:
-        root_logger.removeHandler(h)
+    for h in app_logger.handlers[:]:
+        app_logger.removeHandler(h)
 
+    formatter = MyFormatter()
     stdout_handler = logthings.StreamHandler(sys.stdout)
-    stdout_handler.setFormatter(MyFormatter())
+    stdout_handler.setFormatter(formatter)
     stdout_handler.setLevel(logthings.INFO)
     stdout_handler.addFilter(InfoFilter())
 
     stderr_handler = logthings.StreamHandler(sys.stderr)
-    stderr_handler.setFormatter(MyFormatter())
+    stderr_handler.setFormatter(formatter)
     stderr_handler.setLevel(logthings.WARNING)
     stderr_handler.addFilter(ErrorFilter())
 
@@ -15,25 +15,16 @@ if TYPE_CHECKING:
 from copy import deepcopy
 from datetime import datetime as dt
 from json import loads
-from os import path
-from re import compile, sub
+from re import compile
 
 import boto3
 import jsonschema
 import yaml
-
-try:
-    from yaml import Dumper as Dumper
-    from yaml import Loader as Loader
-except ImportError:
-    from yaml import CDumper as Dumper, CLoader as Loader
-
 from botocore.exceptions import ClientError
 from cfn_flip.yaml_dumper import LongCleanDumper
 from compose_x_common.aws import get_account_id, validate_iam_role_arn
 from compose_x_common.compose_x_common import keyisset, set_else_none
 from compose_x_render.compose_x_render import ComposeDefinition
-from importlib_resources import files as pkg_files
 from troposphere import AWSObject
 
 from ecs_composex import __version__
@@ -45,12 +36,22 @@ from ecs_composex.compose.compose_networks import ComposeNetwork
 from ecs_composex.compose.compose_secrets import ComposeSecret
 from ecs_composex.compose.compose_services import ComposeService
 from ecs_composex.compose.compose_volumes import ComposeVolume
-from ecs_composex.compose.x_resources import XResource
+from ecs_composex.compose.x_resources import (
+    SCHEMA_RESOLVER_BASE_URI,
+    SCHEMA_RESOLVER_SOURCE,
+    XResource,
+)
 from ecs_composex.ecs.ecs_family import ComposeFamily
 from ecs_composex.iam import ROLE_ARN_ARG
 from ecs_composex.utils.init_ecs import set_ecs_settings
 from ecs_composex.utils.init_s3 import create_bucket
 
+RESOURCE_ARN_RE = compile(r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)$")
+RESOURCE_ATTRIBUTE_RE = compile(
+    r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)::(?P<return_value>[\S]+)$"
+)
+FAMILY_NAME_INVALID_CHARS = compile(r"[^a-zA-Z0-9]+")
+
 
 class ComposeXSettings:
     """
@@ -229,15 +230,12 @@ class ComposeXSettings:
         return x_resources
 
     def find_resource(self, compose_resource_arn: str) -> XResource:
-        resource_attribute_match_re = compile(
-            r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)$"
-        )
-        parts = resource_attribute_match_re.match(compose_resource_arn)
+        parts = RESOURCE_ARN_RE.match(compose_resource_arn)
         if not parts:
             raise ValueError(
                 compose_resource_arn,
                 "does not match",
-                resource_attribute_match_re.pattern,
+                RESOURCE_ARN_RE.pattern,
             )
         for resource in self.x_resources:
             if resource.module.res_key == parts.group(
@@ -252,15 +250,10 @@ class ComposeXSettings:
         )
 
     def get_resource_attribute(self, compose_resource_arn: str) -> tuple:
-        import re
-
-        resource_attribute_match_re = re.compile(
-            r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)::(?P<return_value>[\S]+)$"
-        )
-        parts = resource_attribute_match_re.match(compose_resource_arn)
+        parts = RESOURCE_ATTRIBUTE_RE.match(compose_resource_arn)
         if not parts:
             LOG.error(
-                f"{compose_resource_arn} if invalid. Must match, {resource_attribute_match_re.pattern}"
+                f"{compose_resource_arn} if invalid. Must match, {RESOURCE_ATTRIBUTE_RE.pattern}"
             )
             return None, None
         try:
@@ -494,8 +487,8 @@ class ComposeXSettings:
         services_to_assign = [_service for _service in self.services]
         for service in services_to_assign:
             for family_name in service.families:
-                formatted_name = sub(r"[^a-zA-Z0-9]+", "", family_name)
-                if NONALPHANUM.findall(formatted_name):
+                formatted_name = FAMILY_NAME_INVALID_CHARS.sub("", family_name)
+                if NONALPHANUM.search(formatted_name):
                     raise ValueError(
                         "Family names must be ^[a-zA-Z0-9]+$ | alphanumerical"
                     )
@@ -529,14 +522,11 @@ class ComposeXSettings:
         content_def = ComposeDefinition(files, content)
         self.original_content = content_def.definition
         self.compose_content = deepcopy(content_def.definition)
-        source = pkg_files("ecs_composex").joinpath("specs/compose-spec.json")
-        LOG.info(f"Validating against input schema {source}")
-        resolver = jsonschema.RefResolver(
-            f"file://{path.abspath(path.dirname(source))}/", None
-        )
+        LOG.info(f"Validating against input schema {SCHEMA_RESOLVER_SOURCE}")
+        resolver = jsonschema.RefResolver(SCHEMA_RESOLVER_BASE_URI, None)
         jsonschema.validate(
             content_def.definition,
-            loads(source.read_text()),
+            loads(SCHEMA_RESOLVER_SOURCE.read_text()),
             resolver=resolver,
         )
         if fully_load:
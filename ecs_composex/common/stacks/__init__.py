@@ -17,16 +17,7 @@ if TYPE_CHECKING:
 from os import path
 
 from compose_x_common.compose_x_common import keyisset
-from troposphere import (
-    AWS_STACK_NAME,
-    FindInMap,
-    GetAtt,
-    If,
-    ImportValue,
-    Join,
-    Ref,
-    Template,
-)
+from troposphere import AWS_STACK_NAME, FindInMap, GetAtt, Join, Ref, Template
 from troposphere.cloudformation import Stack
 
 from ecs_composex.common import NONALPHANUM, cfn_conditions
@@ -54,11 +45,12 @@ def render_codepipeline_config_file(parameters):
     """
     if not parameters:
         return
-    config = {"Parameters": {}, "Tags": {}}
-
-    for param in parameters:
-        config["Parameters"].update({param["ParameterKey"]: param["ParameterValue"]})
-    return config
+    return {
+        "Parameters": {
+            param["ParameterKey"]: param["ParameterValue"] for param in parameters
+        },
+        "Tags": {},
+    }
 
 
 class ComposeXStack(Stack):
@@ -214,26 +206,19 @@ class ComposeXStack(Stack):
         if not hasattr(self, "Parameters"):
             return []
         params = []
-        for param_name in self.Parameters.keys():
-            LOG.debug(f"{param_name} - {self.Parameters[param_name]}")
-            if not isinstance(
-                self.Parameters[param_name],
-                (Ref, GetAtt, ImportValue, If, Join, type(None)),
-            ):
-                if isinstance(self.Parameters[param_name], (int, str)):
-                    params.append(
-                        {
-                            "ParameterKey": param_name,
-                            "ParameterValue": self.Parameters[param_name],
-                        }
-                    )
-                elif isinstance(self.Parameters[param_name], list):
-                    params.append(
-                        {
-                            "ParameterKey": param_name,
-                            "ParameterValue": ",".join(self.Parameters[param_name]),
-                        }
-                    )
+        for param_name, param_value in self.Parameters.items():
+            LOG.debug("%s - %s", param_name, param_value)
+            if isinstance(param_value, (int, str)):
+                params.append(
+                    {"ParameterKey": param_name, "ParameterValue": param_value}
+                )
+            elif isinstance(param_value, list):
+                params.append(
+                    {
+                        "ParameterKey": param_name,
+                        "ParameterValue": ",".join(param_value),
+                    }
+                )
         return params
 
     def render(self, settings):
@@ -10,15 +10,13 @@ if TYPE_CHECKING:
     from .settings import ComposeXSettings
     from .stacks import ComposeXStack
 
-from copy import deepcopy
-
-from compose_x_common.compose_x_common import keyisset, keypresent, set_else_none
+from compose_x_common.compose_x_common import keyisset, keypresent
 from troposphere import AWS_NO_VALUE, Join, Output
 from troposphere import Parameter as CfnParameter
 from troposphere import Ref, Template
 
 from ecs_composex import __version__ as version
-from ecs_composex.common import DATE, cfn_conditions
+from ecs_composex.common import cfn_conditions, get_run_date
 from ecs_composex.common.cfn_params import ROOT_STACK_NAME, Parameter
 
 
@@ -51,17 +49,54 @@ def init_template(description=None):
     else:
         template = Template("Template generated by ECS ComposeX")
     template.set_metadata(
-        deepcopy(
-            {
-                "Type": "ComposeX",
-                "Properties": {"Version": version, "GeneratedOn": DATE},
-            }
-        )
+        {
+            "Type": "ComposeX",
+            "Properties": {"Version": version, "GeneratedOn": get_run_date()},
+        }
     )
     template.set_version()
     return template
 
 
+class ParameterGroups(list):
+    """
+    List of the AWS::CloudFormation::Interface ParameterGroups, which keeps an index of the groups by label
+    and of the parameters titles in each group, so that adding a parameter does not require to go over all
+    the groups and their parameters.
+    Serializes as a normal list.
+    """
+
+    def __init__(self, groups: list = None):
+        super().__init__(groups if groups else [])
+        self._groups_index: dict = {}
+        for group in self:
+            self._index_group(group)
+
+    def _index_group(self, group: dict) -> None:
+        label = group["Label"]["default"]
+        if label not in self._groups_index:
+            self._groups_index[label] = (group, set(group["Parameters"]))
+
+    def add_parameter(self, parameter: Parameter) -> None:
+        """
+        Adds the parameter title to its group, and creates the group if it does not exist yet.
+
+        :param ecs_composex.common.cfn_params.Parameter parameter:
+        """
+        if parameter.group_label in self._groups_index:
+            group, titles = self._groups_index[parameter.group_label]
+            if parameter.title not in titles:
+                group["Parameters"].append(parameter.title)
+                titles.add(parameter.title)
+        else:
+            group = {
+                "Label": {"default": parameter.group_label},
+                "Parameters": [parameter.title],
+            }
+            self.append(group)
+            self._index_group(group)
+
+
 def add_parameter_to_group_label(
     interface_metadata: dict, parameter: Parameter
 ) -> None:
@@ -72,28 +107,11 @@ def add_parameter_to_group_label(
     :param dict interface_metadata:
     :param ecs_composex.common.cfn_params.Parameter parameter:
     """
-    groups = set_else_none("ParameterGroups", interface_metadata, [], eval_bool=True)
-    if not groups:
+    groups = interface_metadata.get("ParameterGroups")
+    if not isinstance(groups, ParameterGroups):
+        groups = ParameterGroups(groups)
         interface_metadata["ParameterGroups"] = groups
-        groups.append(
-            {
-                "Label": {"default": parameter.group_label},
-                "Parameters": [parameter.title],
-            }
-        )
-    else:
-        for group in groups:
-            if group["Label"]["default"] == parameter.group_label:
-                if parameter.title not in group["Parameters"]:
-                    group["Parameters"].append(parameter.title)
-                break
-        else:
-            groups.append(
-                {
-                    "Label": {"default": parameter.group_label},
-                    "Parameters": [parameter.title],
-                }
-            )
+    groups.add_parameter(parameter)
 
 
 def add_parameters_metadata(template, parameter):
@@ -105,24 +123,17 @@ def add_parameters_metadata(template, parameter):
     :param parameter:
     :return:
     """
-    if not hasattr(template, "metadata"):
+    metadata = getattr(template, "metadata", None)
+    if metadata is None:
         metadata = {}
-    else:
-        metadata = getattr(template, "metadata")
-    interface_metadata = set_else_none("AWS::CloudFormation::Interface", metadata, {})
-    if not interface_metadata:
-        metadata["AWS::CloudFormation::Interface"] = interface_metadata
+        template.metadata = metadata
+    interface_metadata = metadata.setdefault("AWS::CloudFormation::Interface", {})
     if parameter.group_label:
         add_parameter_to_group_label(interface_metadata, parameter)
     if parameter.label:
-        labels = set_else_none(
-            "ParameterLabels", interface_metadata, {}, eval_bool=True
-        )
-        if not labels:
-            interface_metadata["ParameterLabels"] = labels
-            labels[parameter.title] = {"default": parameter.label}
-        else:
-            labels.update({parameter.title: {"default": parameter.label}})
+        interface_metadata.setdefault("ParameterLabels", {})[parameter.title] = {
+            "default": parameter.label
+        }
 
 
 def add_parameters(template: Template, parameters: list) -> None:
@@ -133,12 +144,13 @@ def add_parameters(template: Template, parameters: list) -> None:
     :param parameters: list of parameters to add to the template
     :type parameters: list<ecs_composex.common.cfn_params.Parameter>
     """
+    template_parameters = template.parameters if template else None
     for param in parameters:
-        if not isinstance(param, (Parameter, CfnParameter)) or not issubclass(
-            type(param), (Parameter, CfnParameter)
-        ):
+        if not isinstance(param, (Parameter, CfnParameter)):
             raise TypeError("Parameter must be of type", Parameter, "Got", type(param))
-        if template and param.title not in template.parameters:
+        if not template:
+            continue
+        if param.title not in template_parameters:
             template.add_parameter(param)
         if isinstance(param, Parameter) and (param.group_label or param.label):
             add_parameters_metadata(template, param)
@@ -152,10 +164,11 @@ def add_outputs(template, outputs):
     :param outputs: list of parameters to add to the template
     :type outputs: list<troposphere.Output>
     """
+    template_outputs = template.outputs if template else None
     for output in outputs:
         if not isinstance(output, Output):
             raise TypeError("Parameter must be of type", Output)
-        if template and output.title not in template.outputs:
+        if template and output.title not in template_outputs:
             template.add_output(output)
 
 
@@ -168,19 +181,17 @@ def add_update_mapping(template, mapping_key, mapping_value, mapping_subkey=None
     :param str mapping_subkey: If set, applies the value to a sub-key of the mapping on update
     :return:
     """
-    if mapping_key not in template.mappings:
+    existing_mapping = template.mappings.get(mapping_key)
+    if existing_mapping is None:
         template.add_mapping(mapping_key, mapping_value)
+    elif not mapping_subkey:
+        existing_mapping.update(mapping_value)
     else:
-        if mapping_subkey and keyisset(mapping_subkey, template.mappings[mapping_key]):
-            template.mappings[mapping_key][mapping_subkey].update(mapping_value)
-        elif (
-            mapping_key
-            and mapping_subkey
-            and not keyisset(mapping_subkey, template.mappings[mapping_key])
-        ):
-            template.mappings[mapping_key][mapping_subkey] = mapping_value
-        elif not mapping_subkey:
-            template.mappings[mapping_key].update(mapping_value)
+        existing_submapping = existing_mapping.get(mapping_subkey)
+        if existing_submapping:
+            existing_submapping.update(mapping_value)
+        else:
+            existing_mapping[mapping_subkey] = mapping_value
 
 
 def add_resource(template, resource, replace=False) -> AWSObject:
@@ -191,12 +202,9 @@ def add_resource(template, resource, replace=False) -> AWSObject:
     :param troposphere.AWSObject resource:
     :param bool replace:
     """
-    if (
-        resource not in template.resources.values()
-        and resource.title not in template.resources.keys()
-    ):
+    if resource.title not in template.resources:
         return template.add_resource(resource)
-    elif resource.title in template.resources and replace:
+    elif replace:
         template.resources[resource.title] = resource
         return resource
 
@@ -206,10 +214,7 @@ def set_get_resource(template, resource) -> (AWSObject, bool):
     Function to add resource to template if the resource does not already exist
     Returns the resource if it already does.
     """
-    if (
-        resource not in template.resources.values()
-        and resource.title not in template.resources.keys()
-    ):
+    if resource.title not in template.resources:
         return template.add_resource(resource), False
     return template.resources[resource.title], True
 
@@ -221,10 +226,12 @@ def add_defaults(template):
     :param template: source template to add the params and conditions to
     :type template: Template
     """
-    template.add_parameter(ROOT_STACK_NAME)
-    template.add_condition(
-        cfn_conditions.USE_STACK_NAME_CON_T, cfn_conditions.USE_STACK_NAME_CON
-    )
+    if ROOT_STACK_NAME.title not in template.parameters:
+        template.add_parameter(ROOT_STACK_NAME)
+    if cfn_conditions.USE_STACK_NAME_CON_T not in template.conditions:
+        template.add_condition(
+            cfn_conditions.USE_STACK_NAME_CON_T, cfn_conditions.USE_STACK_NAME_CON
+        )
 
 
 def build_template(description=None, *parameters):
@@ -8,7 +8,7 @@ from troposphere.ecs import EnvironmentFile
 from troposphere.iam import PolicyType
 
 import ecs_composex.common.troposphere_tools
-from ecs_composex.common import FILE_PREFIX
+from ecs_composex.common import get_file_prefix
 from ecs_composex.common.files import upload_file
 from ecs_composex.common.logging import LOG
 
@@ -61,6 +61,7 @@ def upload_services_env_files(family, settings) -> None:
             f"{family.name} When running as a Macro, you cannot upload environment files."
         )
         return
+    file_prefix = get_file_prefix()
     for service in family.services:
         env_files = []
         for env_file in service.env_files:
@@ -72,7 +73,7 @@ def upload_services_env_files(family, settings) -> None:
                     body=file_body,
                     bucket_name=settings.bucket_name,
                     mime="text/plain",
-                    prefix=f"{FILE_PREFIX}/env_files",
+                    prefix=f"{file_prefix}/env_files",
                     file_name=object_name,
                     settings=settings,
                 )
@@ -83,7 +84,7 @@ def upload_services_env_files(family, settings) -> None:
                 LOG.error(f"Failed to upload env file {object_name}")
                 raise
             file_path = Sub(
-                f"arn:${{{AWS_PARTITION}}}:s3:::{settings.bucket_name}/{FILE_PREFIX}/env_files/{object_name}"
+                f"arn:${{{AWS_PARTITION}}}:s3:::{settings.bucket_name}/{file_prefix}/env_files/{object_name}"
             )
             env_files.append(EnvironmentFile(Type="s3", Value=file_path))
         if not hasattr(service.container_definition, "EnvironmentFiles"):
@@ -12,27 +12,34 @@ from typing import TYPE_CHECKING, Union
 if TYPE_CHECKING:
     from ecs_composex.common.settings import ComposeXSettings
 
-import json
 import re
-from copy import deepcopy
-from os import path
+from functools import cached_property, lru_cache
+from os import listdir, path
+
+try:
+    from orjson import OPT_SORT_KEYS, dumps, loads
+
+    HAS_ORJSON = True
+except ImportError:
+    from json import dumps, loads
+
+    HAS_ORJSON = False
 
 import jsonschema
-from compose_x_common.aws import get_account_id
 from compose_x_common.compose_x_common import (
     attributes_to_mapping,
     keyisset,
     keypresent,
-    set_else_none,
 )
 from importlib_resources import files as pkg_files
 from troposphere import AWSObject, Export, FindInMap, GetAtt, Join, Output, Ref, Sub
 from troposphere.ecs import Environment
 
-from ecs_composex.common import NONALPHANUM, get_nested_property
+from ecs_composex.common import alnum, get_nested_property
 from ecs_composex.common.aws import (
     define_lookup_role_from_info,
     find_aws_resource_arn_from_tags_api,
+    get_session_account_id,
 )
 from ecs_composex.common.cfn_conditions import define_stack_name
 from ecs_composex.common.cfn_params import Parameter
@@ -44,10 +51,135 @@ from ecs_composex.common.troposphere_tools import (
     add_update_mapping,
     add_update_parameter_recursively,
 )
-from ecs_composex.mods_manager import XResourceModule
+from ecs_composex.mods_manager import XResourceModule, load_json_schema
 from ecs_composex.resource_settings import get_parameter_settings
 
+MODULE_TAG_KEY = f"compose-x{TAGS_SEPARATOR}module"
+RESOURCE_NAME_TAG_KEY = f"compose-x{TAGS_SEPARATOR}resource_name"
+LOGICAL_NAME_TAG_KEY = f"compose-x{TAGS_SEPARATOR}logical_name"
 ENV_VAR_NAME = re.compile(r"([^a-zA-Z0-9_]+)")
+ENV_VAR_NAME_TRANSLATION = str.maketrans(
+    "-",
+    "_",
+    "".join(
+        _char
+        for _char in map(chr, range(128))
+        if not (_char.isalnum() or _char in "-_")
+    ),
+)
+SCHEMA_VALIDATORS: dict = {}
+VALIDATED_DEFINITIONS: dict = {}
+SCHEMA_RESOLVER_SOURCE = pkg_files("ecs_composex").joinpath("specs/compose-spec.json")
+SCHEMA_RESOLVER_BASE_URI = (
+    f"file://{path.abspath(path.dirname(SCHEMA_RESOLVER_SOURCE))}/"
+)
+
+
+@lru_cache(maxsize=None)
+def get_env_var_name(name: str) -> str:
+    """
+    Returns the environment variable name for a given name: upper case, - replaced with _, and
+    any other character than letters, digits and _ removed.
+
+    :param str name:
+    :rtype: str
+    """
+    env_var_name = name.upper()
+    if env_var_name.isascii():
+        return env_var_name.translate(ENV_VAR_NAME_TRANSLATION)
+    return ENV_VAR_NAME.sub("", env_var_name.replace("-", "_"))
+
+
+def definition_fingerprint(definition: dict) -> bytes:
+    """
+    Serializes the definition with sorted keys, to identify definitions already validated.
+
+    :raises TypeError: if the definition is not JSON serializable
+    """
+    if HAS_ORJSON:
+        return dumps(definition, option=OPT_SORT_KEYS)
+    return dumps(definition, sort_keys=True).encode()
+
+
+@lru_cache(maxsize=None)
+def get_schema_refs_store() -> dict:
+    """
+    Returns the parsed JSON schemas found next to the compose-x spec, keyed by their URI, for the
+    RefResolver to find the schemas referred to by the modules schemas without reading them from disk.
+    The store returned is shared and must not be modified.
+
+    :rtype: dict
+    """
+    specs_dir = path.dirname(SCHEMA_RESOLVER_SOURCE)
+    return {
+        f"{SCHEMA_RESOLVER_BASE_URI}{file_name}": load_json_schema(
+            path.join(specs_dir, file_name)
+        )
+        for file_name in sorted(listdir(specs_dir))
+        if file_name.endswith(".json")
+    }
+
+
+def get_schema_validator(module_name: str, schema: dict):
+    """
+    Returns a JSON schema validator for the module schema. The validator class is only looked up and
+    checked against its meta-schema once per module. Each validator gets a new RefResolver, as the
+    resolver keeps the scopes pushed while validating, but shares the store of already parsed schemas.
+
+    :param str module_name:
+    :param dict schema:
+    """
+    cached = SCHEMA_VALIDATORS.get(module_name)
+    if cached and cached[0] is schema:
+        validator_class = cached[1]
+    else:
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        SCHEMA_VALIDATORS[module_name] = (schema, validator_class)
+    LOG.debug(f"Validating against input schema {SCHEMA_RESOLVER_SOURCE}")
+    resolver = jsonschema.RefResolver(
+        base_uri=SCHEMA_RESOLVER_BASE_URI,
+        referrer=schema,
+        store=get_schema_refs_store(),
+    )
+    return validator_class(schema, resolver=resolver)
+
+
+def ref_output_value(output_definition: tuple) -> Union[Ref, None]:
+    if issubclass(type(output_definition[1]), AWSObject):
+        return Ref(output_definition[1])
+    return None
+
+
+def getatt_output_value(output_definition: tuple) -> GetAtt:
+    return GetAtt(output_definition[1], output_definition[3])
+
+
+def sub_output_value(output_definition: tuple) -> Union[Sub, None]:
+    if len(output_definition) == 4:
+        return Sub(output_definition[3])
+    elif len(output_definition) == 5:
+        return Sub(output_definition[3], output_definition[4])
+    return None
+
+
+def join_output_value(output_definition: tuple) -> Join:
+    if not isinstance(output_definition[3], list):
+        raise ValueError(
+            "For Join, the parameter must be",
+            list,
+            "Got",
+            type(output_definition[3]),
+        )
+    return Join(*output_definition[3])
+
+
+OUTPUT_VALUE_BUILDERS: dict = {
+    Ref: ref_output_value,
+    GetAtt: getatt_output_value,
+    Sub: sub_output_value,
+    Join: join_output_value,
+}
 
 
 class XResource:
@@ -85,14 +217,14 @@ class XResource:
         self.iam_manager = None
         self.cloud_control_attributes_mapping = {}
         self.native_attributes_mapping = {}
-        self.definition = deepcopy(definition)
+        self.definition = dict(definition)
         self.env_names = []
         self.env_vars = []
         self.validators = []
-        self.logical_name = NONALPHANUM.sub("", self.name)
-        self.settings = set_else_none("Settings", definition, alt_value={})
-        self.parameters = set_else_none("MacroParameters", definition, alt_value={})
-        self.lookup = set_else_none("Lookup", definition, alt_value={})
+        self.logical_name = alnum(self.name)
+        self.settings = definition.get("Settings") or {}
+        self.parameters = definition.get("MacroParameters") or {}
+        self.lookup = definition.get("Lookup") or {}
         if self.lookup:
             self.lookup_session = define_lookup_role_from_info(
                 self.lookup, settings.session
@@ -100,27 +232,23 @@ class XResource:
             self.properties = {}
         else:
             self.lookup_session = settings.session
-            self.properties = set_else_none("Properties", definition)
+            self.properties = definition.get("Properties") or None
         self.support_defaults: bool = False
-        self.scaling = set_else_none("Scaling", self.definition)
+        self.scaling = definition.get("Scaling") or None
         self.scaling_target = None
         self.cfn_resource = None
         self.output_properties = {}
         self.outputs = []
         self.attributes_outputs = {}
+        self._res_return_names: dict = {}
+        self._res_return_names_source: tuple = (None, 0)
 
         self.is_nested = False
         self.stack = None
         self.ref_parameter = None
         self.lookup_properties = {}
         self.mappings = {}
-        self.default_tags = {
-            f"compose-x{TAGS_SEPARATOR}module": self.module.mod_key,
-            f"compose-x{TAGS_SEPARATOR}resource_name": self.name,
-            f"compose-x{TAGS_SEPARATOR}logical_name": self.logical_name,
-        }
-        self.cloudmap_settings = set_else_none("x-cloudmap", self.settings, {})
-        self.default_cloudmap_settings = {}
+        self.cloudmap_settings = self.settings.get("x-cloudmap") or {}
         self.cloudmap_dns_supported = False
         self.policies_scaffolds = module.iam_policies
         self.resource_policy = None
@@ -130,11 +258,48 @@ class XResource:
 
     @property
     def uses_default(self) -> bool:
-        return not any([self.lookup, self.parameters, self.properties])
+        return not (self.lookup or self.parameters or self.properties)
+
+    @cached_property
+    def default_tags(self) -> dict:
+        return {
+            MODULE_TAG_KEY: self.module.mod_key,
+            RESOURCE_NAME_TAG_KEY: self.name,
+            LOGICAL_NAME_TAG_KEY: self.logical_name,
+        }
+
+    @cached_property
+    def default_cloudmap_settings(self) -> dict:
+        """
+        Defaults to an empty mapping. Resources supporting CloudMap override it in their __init__
+        """
+        return {}
+
+    @property
+    def res_return_names(self) -> dict:
+        """
+        Mapping of the attributes outputs return value (or title) to their parameter.
+        attributes_outputs only ever gets new keys, so the mapping is rebuilt when its size changes.
+        """
+        _source, _size = self._res_return_names_source
+        if _source is not self.attributes_outputs or _size != len(_source):
+            self._res_return_names = {
+                (
+                    prop_param.return_value
+                    if prop_param.return_value
+                    else prop_param.title
+                ): prop_param
+                for prop_param in self.attributes_outputs
+            }
+            self._res_return_names_source = (
+                self.attributes_outputs,
+                len(self.attributes_outputs),
+            )
+        return self._res_return_names
 
     @property
     def env_var_prefix(self) -> str:
-        return ENV_VAR_NAME.sub("", self.name.replace("-", "_").upper())
+        return get_env_var_name(self.name)
 
     @property
     def compose_x_arn(self) -> str:
@@ -178,21 +343,24 @@ class XResource:
         """
         if not self.module.json_schema and not module_schema:
             return
-        resolver_source = pkg_files("ecs_composex").joinpath("specs/compose-spec.json")
-        LOG.debug(f"Validating against input schema {resolver_source}")
-        resolver = jsonschema.RefResolver(
-            base_uri=f"file://{path.abspath(path.dirname(resolver_source))}/",
-            referrer=self.module.json_schema,
-        )
+        schema = module_schema if module_schema else self.module.json_schema
+        validated = VALIDATED_DEFINITIONS.get(module_name)
+        if not validated or validated[0] is not schema:
+            validated = (schema, set())
+            VALIDATED_DEFINITIONS[module_name] = validated
         try:
-            jsonschema.validate(
-                definition,
-                module_schema if module_schema else self.module.json_schema,
-                resolver=resolver,
-            )
-        except jsonschema.exceptions.ValidationError:
+            fingerprint = definition_fingerprint(definition)
+        except (TypeError, ValueError):
+            fingerprint = None
+        if fingerprint is not None and fingerprint in validated[1]:
+            return
+        validator = get_schema_validator(module_name, schema)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(definition))
+        if error is not None:
             LOG.error(f"{module_name}.{name} - Definition is not conform to schema.")
-            raise
+            raise error
+        if fingerprint is not None:
+            validated[1].add(fingerprint)
 
     def cloud_control_attributes_mapping_lookup(
         self, resource_type, resource_id, **kwargs
@@ -206,7 +374,7 @@ class XResource:
             props_r = client.get_resource(
                 TypeName=resource_type, Identifier=resource_id, **kwargs
             )
-            properties = json.loads(props_r["ResourceDescription"]["Properties"])
+            properties = loads(props_r["ResourceDescription"]["Properties"])
             props = attributes_to_mapping(
                 properties, self.cloud_control_attributes_mapping
             )
@@ -281,7 +449,7 @@ class XResource:
                 f"{self.module.res_key}.{self.name} - Failed to find the AWS Resource with given tags"
             )
         props = {}
-        _account_id = get_account_id(self.lookup_session)
+        _account_id = get_session_account_id(self.lookup_session)
         LOG.debug("arn: %s - account_id: %s", self.arn, _account_id)
         if _account_id == account_id and self.cloud_control_attributes_mapping:
             props = self.cloud_control_attributes_mapping_lookup(
@@ -312,10 +480,10 @@ class XResource:
                 )
             if parameter.return_value:
                 if parameter.return_value not in self.mappings:
-                    self.mappings[NONALPHANUM.sub("", parameter.return_value)] = value
+                    self.mappings[alnum(parameter.return_value)] = value
                 else:
                     self.mappings[
-                        parameter.title + NONALPHANUM.sub("", parameter.return_value)
+                        parameter.title + alnum(parameter.return_value)
                     ] = value
             else:
                 self.mappings[parameter.title] = value
@@ -378,14 +546,9 @@ class XResource:
         Generates env vars based on ReturnValues set for a give service. When the resource is new, adds the
         parameter to the services stack appropriately.
         """
-        res_return_names = {}
         if hasattr(self, "add_extra_outputs"):
             self.add_extra_outputs()
-        for prop_param in self.attributes_outputs:
-            if prop_param.return_value:
-                res_return_names[prop_param.return_value] = prop_param
-            else:
-                res_return_names[prop_param.title] = prop_param
+        res_return_names = self.res_return_names
         env_vars = []
         params_to_add = []
 
@@ -397,7 +560,7 @@ class XResource:
             self.ref_parameter
             and self.ref_parameter.title not in target_definition.keys()
         ):
-            env_var_name = ENV_VAR_NAME.sub("", self.name.replace("-", "_").upper())
+            env_var_name = self.env_var_prefix
             target_definition[self.ref_parameter.title] = env_var_name
             LOG.info(
                 f"{self.module.res_key}.{self.name} - Auto-added {env_var_name} for Ref value"
@@ -450,7 +613,7 @@ class XResource:
                 f"{self.module.res_key}.{self.name}. Default ref_parameter not set. Skipping env_vars"
             )
             return []
-        env_var_name = ENV_VAR_NAME.sub("", self.name.upper().replace("-", "_"))
+        env_var_name = self.env_var_prefix
         if self.cfn_resource and self.attributes_outputs and self.ref_parameter:
             ref_env_var = Environment(
                 Name=env_var_name,
@@ -483,8 +646,8 @@ class XResource:
         :return: The FindInMap setting for mapped resource
         """
         if attribute_parameter.return_value:
-            long_name = attribute_parameter.title + NONALPHANUM.sub(
-                "", attribute_parameter.return_value
+            long_name = attribute_parameter.title + alnum(
+                attribute_parameter.return_value
             )
         else:
             long_name = attribute_parameter.title
@@ -494,68 +657,59 @@ class XResource:
             return FindInMap(
                 self.module.mapping_key,
                 self.logical_name,
-                NONALPHANUM.sub("", attribute_parameter.return_value),
+                alnum(attribute_parameter.return_value),
             )
         else:
             return FindInMap(
                 self.module.mapping_key, self.logical_name, attribute_parameter.title
             )
 
-    def define_export_name(self, output_definition, attribute_parameter):
+    def define_export_name(
+        self, output_definition, attribute_parameter, stack_name=None
+    ):
         """
         Method to define the export name for the resource
+
+        :param stack_name: The stack name construct to use. Defaults to define_stack_name()
         :return:
         """
+        if stack_name is None:
+            stack_name = define_stack_name()
         if len(output_definition) == 5 and output_definition[4]:
             LOG.debug(f"Adding portback output for {self.name}")
             export = Export(
                 Sub(
                     f"${{STACK_NAME}}{DELIM}{self.name}{DELIM}{output_definition[4]}",
-                    STACK_NAME=define_stack_name(),
+                    STACK_NAME=stack_name,
                 )
             )
         else:
             export = Export(
                 Sub(
                     f"${{STACK_NAME}}{DELIM}{self.logical_name}{DELIM}{attribute_parameter.title}",
-                    STACK_NAME=define_stack_name(),
+                    STACK_NAME=stack_name,
                 ),
             )
         return export
 
-    def set_new_resource_outputs(self, output_definition, attribute_parameter):
+    def set_new_resource_outputs(
+        self, output_definition, attribute_parameter, stack_name=None
+    ):
         """
         Method to define the outputs for the resource when new
+
+        :param stack_name: The stack name construct to use for the export name
         """
-        if output_definition[2] is Ref and issubclass(
-            type(output_definition[1]), AWSObject
-        ):
-            value = Ref(output_definition[1])
-        elif output_definition[2] is GetAtt:
-            value = GetAtt(output_definition[1], output_definition[3])
-        elif output_definition[2] is Sub and len(output_definition) == 4:
-            value = Sub(output_definition[3])
-        elif output_definition[2] is Sub and len(output_definition) == 5:
-            value = Sub(output_definition[3], output_definition[4])
-        elif output_definition[2] is Join:
-            if not isinstance(output_definition[3], list):
-                raise ValueError(
-                    "For Join, the parameter must be",
-                    list,
-                    "Got",
-                    type(output_definition[3]),
+        output_type = output_definition[2]
+        value = None
+        if isinstance(output_type, (str, int)):
+            if output_definition[3] is False:
+                value = (
+                    output_type if isinstance(output_type, str) else str(output_type)
                 )
-            value = Join(*output_definition[3])
-        elif (
-            isinstance(output_definition[2], (str, int))
-            and output_definition[3] is False
-        ):
-            value = (
-                output_definition[2]
-                if isinstance(output_definition[2], str)
-                else str(output_definition[2])
-            )
-        else:
+        elif isinstance(output_type, type) and output_type in OUTPUT_VALUE_BUILDERS:
+            value = OUTPUT_VALUE_BUILDERS[output_type](output_definition)
+        if value is None:
             raise TypeError(
                 output_definition,
                 f"3rd argument for {output_definition[0]} must be one of",
@@ -563,7 +717,9 @@ class XResource:
                 "Got",
                 output_definition[2],
             )
-        export = self.define_export_name(output_definition, attribute_parameter)
+        export = self.define_export_name(
+            output_definition, attribute_parameter, stack_name
+        )
         return value, export
 
     def add_new_output_attribute(
@@ -573,14 +729,54 @@ class XResource:
         generate_outputs: bool = True,
     ):
         """
-        Adds a new output to attributes and re-generates all outputs
+        Adds a new output to attributes. For new resources, only generates the output of the new attribute.
+        For lookup resources, re-generates all outputs.
         """
-        if not self.output_properties:
-            self.output_properties = {attribute_id: attribute_config}
-        else:
-            self.output_properties.update({attribute_id: attribute_config})
-        if generate_outputs:
+        self.output_properties[attribute_id] = attribute_config
+        if not generate_outputs:
+            return
+        if self.lookup_properties:
             self.generate_outputs()
+        else:
+            self.outputs.append(
+                self.set_new_attribute_output(attribute_id, attribute_config)["Output"]
+            )
+
+    def set_new_attribute_output(
+        self, attribute_parameter: Parameter, output_definition: tuple, stack_name=None
+    ) -> dict:
+        """
+        Sets the attributes_outputs entry of a new resource attribute, from its output definition
+
+        :param attribute_parameter:
+        :param output_definition:
+        :param stack_name: The stack name construct to use for the export name
+        :return: the attribute output definition
+        """
+        output_name = alnum(output_definition[0])
+        value, export = self.set_new_resource_outputs(
+            output_definition, attribute_parameter, stack_name
+        )
+        self.attributes_outputs[attribute_parameter] = {
+            "Name": output_name,
+            "Output": Output(output_name, Value=value, Export=export),
+            "ImportParameter": Parameter(
+                output_name,
+                group_label=attribute_parameter.group_label
+                if attribute_parameter.group_label
+                else self.module.mod_key,
+                return_value=attribute_parameter.return_value,
+                Type=attribute_parameter.Type,
+            ),
+            "ImportValue": GetAtt(
+                self.stack.get_top_root_stack()
+                if self.stack
+                else self.module.mapping_key,
+                f"Outputs.{output_name}",
+            ),
+            "Original": attribute_parameter,
+        }
+        return self.attributes_outputs[attribute_parameter]
 
     def generate_outputs(self):
         """
@@ -605,35 +801,14 @@ class XResource:
                     ),
                 }
         elif self.output_properties and not self.lookup_properties:
+            stack_name = define_stack_name()
             for (
                 attribute_parameter,
                 output_definition,
             ) in self.output_properties.items():
-                output_name = NONALPHANUM.sub("", output_definition[0])
-                settings = self.set_new_resource_outputs(
-                    output_definition, attribute_parameter
+                self.set_new_attribute_output(
+                    attribute_parameter, output_definition, stack_name
                 )
-                value = settings[0]
-                export = settings[1]
-                self.attributes_outputs[attribute_parameter] = {
-                    "Name": output_name,
-                    "Output": Output(output_name, Value=value, Export=export),
-                    "ImportParameter": Parameter(
-                        output_name,
-                        group_label=attribute_parameter.group_label
-                        if attribute_parameter.group_label
-                        else self.module.mod_key,
-                        return_value=attribute_parameter.return_value,
-                        Type=attribute_parameter.Type,
-                    ),
-                    "ImportValue": GetAtt(
-                        self.stack.get_top_root_stack()
-                        if self.stack
-                        else self.module.mapping_key,
-                        f"Outputs.{output_name}",
-                    ),
-                    "Original": attribute_parameter,
-                }
         for attr in self.attributes_outputs.values():
             if keyisset("Output", attr):
                 self.outputs.append(attr["Output"])
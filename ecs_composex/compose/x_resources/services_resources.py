@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 
 from compose_x_common.compose_x_common import keyisset, set_else_none
 
-from ecs_composex.common import NONALPHANUM
+from ecs_composex.common import alnum
 from ecs_composex.common.logging import LOG
 from ecs_composex.compose.x_resources import XResource
 from ecs_composex.compose.x_resources.helpers import get_setting_key
@@ -84,7 +84,7 @@ class ServicesXResource(XResource):
             0
         ]
         for family_name in the_service.families:
-            family_name = NONALPHANUM.sub("", family_name)
+            family_name = alnum(family_name)
             if family_name not in [f[0].name for f in self.families_targets]:
                 self.families_targets.append(
                     (
@@ -148,7 +148,7 @@ class ServicesXResource(XResource):
                 [_svc.name for _svc in settings.services],
             )
         for family_name in the_service.families:
-            family_name = NONALPHANUM.sub("", family_name)
+            family_name = alnum(family_name)
             if family_name not in [f[0].name for f in self.families_targets]:
                 self.families_targets.append(
                     (
@@ -234,7 +234,7 @@ class ServicesXResource(XResource):
         scaling_key = get_setting_key("scaling", service)
         the_service = [s for s in settings.services if s.name == service[name_key]][0]
         for family_name in the_service.families:
-            family_name = NONALPHANUM.sub("", family_name)
+            family_name = alnum(family_name)
             if family_name not in [f[0].name for f in self.families_scaling]:
                 self.families_scaling.append(
                     (settings.families[family_name], service[scaling_key])
@@ -284,7 +284,7 @@ class ServicesXResource(XResource):
         """
         the_service = [s for s in settings.services if s.name == service_name][0]
         for family_name in the_service.families:
-            family_name = NONALPHANUM.sub("", family_name)
+            family_name = alnum(family_name)
             if family_name not in [f[0].name for f in self.families_scaling]:
                 self.families_scaling.append(
                     (
@@ -223,26 +223,24 @@ class FamilyLogging:
         If the region was passed in the log driver options, just grant access to any lo group
         ElIf the group name is set and is a string, passed by the log driver options, just grant access to it.
         """
-        if not self.family.template:
+        family = self.family
+        if not family.template:
             raise AttributeError(
-                self.family.name,
+                family.name,
                 "Template not yet initialized. Must have a valid template to configure logging",
             )
 
-        for service in chain(
-            self.family.managed_sidecars, self.family.ordered_services
-        ):
+        for service in chain(family.managed_sidecars, family.ordered_services):
             if service in use_firelens:
                 continue
-            if keyisset("awslogs-region", service.logging.log_options) and isinstance(
-                service.logging.log_options["awslogs-region"], str
+            log_options = service.logging.log_options
+            if keyisset("awslogs-region", log_options) and isinstance(
+                log_options["awslogs-region"], str
             ):
-                logging_from_defined_region(self.family, service)
-            elif keyisset(
-                "awslogs-group", service.logging.log_options
-            ) and not isinstance(
-                service.logging.log_options["awslogs-group"], (Ref, Sub)
+                logging_from_defined_region(family, service)
+            elif keyisset("awslogs-group", log_options) and not isinstance(
+                log_options["awslogs-group"], (Ref, Sub)
             ):
                 add_container_level_log_group(
-                    self.family, service, f"{service.logical_name}LogGroupAccess"
+                    family, service, f"{service.logical_name}LogGroupAccess"
                 )
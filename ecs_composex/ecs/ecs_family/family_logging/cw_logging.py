@@ -25,6 +25,12 @@ LOGGING_ACTIONS = [
     "logs:Describe*",
 ]
 LOGGING_IAM_PERMISSIONS_MODEL: dict = {"Effect": "Allow", "Action": LOGGING_ACTIONS}
+LOGGING_ALL_LOG_GROUPS_STATEMENT: dict = {
+    "Sid": "AllowCloudWatchLoggingToSpecificLogGroup",
+    "Effect": "Allow",
+    "Action": LOGGING_ACTIONS,
+    "Resource": Sub("arn:${AWS::Partition}:logs:*:${AWS::AccountId}:log-group:*"),
+}
 
 
 def create_log_group(
@@ -113,22 +119,19 @@ def logging_from_defined_region(family: ComposeFamily, service: ComposeService)
         f"{family.name}.logging.awslogs driver "
         "- When defining awslogs-region, Compose-X does not create the CW Log Group"
     )
-    family.iam_manager.exec_role.cfn_resource.Policies.append(
-        Policy(
-            PolicyName=f"CloudWatchAccessFor{family.logical_name}",
-            PolicyDocument={
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Sid": "AllowCloudWatchLoggingToSpecificLogGroup",
-                        "Effect": "Allow",
-                        "Action": LOGGING_ACTIONS,
-                        "Resource": Sub(
-                            "arn:${AWS::Partition}:logs:*:${AWS::AccountId}:log-group:*"
-                        ),
-                    }
-                ],
-            },
+    policy_name = f"CloudWatchAccessFor{family.logical_name}"
+    exec_role_policies = family.iam_manager.exec_role.cfn_resource.Policies
+    if not any(
+        getattr(policy, "PolicyName", None) == policy_name
+        for policy in exec_role_policies
+    ):
+        exec_role_policies.append(
+            Policy(
+                PolicyName=policy_name,
+                PolicyDocument={
+                    "Version": "2012-10-17",
+                    "Statement": [LOGGING_ALL_LOG_GROUPS_STATEMENT],
+                },
+            )
         )
-    )
     service.logging.log_options.update({"awslogs-create-group": True})
@@ -14,7 +14,7 @@ from compose_x_common.aws.kinesis import KINESIS_STREAM_ARN_RE
 from compose_x_common.compose_x_common import keyisset
 from troposphere import Region
 
-from ecs_composex.compose.x_resources import ENV_VAR_NAME
+from ecs_composex.compose.x_resources import get_env_var_name
 from ecs_composex.ecs.ecs_firelens.firelens_options_generic_helpers import (
     handle_cross_account_permissions,
 )
@@ -118,9 +118,7 @@ class FireLensKinesisManagedDestination:
     def delivery_stream_env_var_name(self):
         if self._managed_data_stream:
             return self._managed_data_stream.env_var_prefix
-        return ENV_VAR_NAME.sub(
-            "", self.delivery_stream.upper().replace("-", "_").replace(".", "_")
-        )
+        return get_env_var_name(self.delivery_stream.replace(".", "_"))
 
     @property
     def delivery_stream_fluent_env_var(self):
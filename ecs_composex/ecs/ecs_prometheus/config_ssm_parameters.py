@@ -11,7 +11,6 @@ if TYPE_CHECKING:
     from ecs_composex.ecs.ecs_family import ComposeFamily
 
 import json
-from os import path
 
 import yaml
 from compose_x_common.compose_x_common import keyisset
@@ -20,12 +19,11 @@ from troposphere.ssm import Parameter as SSMParameter
 
 try:
     from yaml import CDumper as Dumper
-    from yaml import CLoader as Loader
 except ImportError:
     from yaml import Dumper as Dumper
-    from yaml import Loader as Loader
 
 from ecs_composex.common.cfn_params import STACK_ID_SHORT
+from ecs_composex.common.files import load_yaml_file
 from ecs_composex.common.troposphere_tools import add_resource
 from ecs_composex.ecs import ecs_params
 from ecs_composex.ecs.ecs_prometheus.emf_processors import generate_emf_processors
@@ -46,10 +44,7 @@ def set_cw_prometheus_config_parameter(
     if keyisset("ScrapingConfiguration", options):
         scrape_config = options["ScrapingConfiguration"]
     if keyisset("ScrapingConfigurationFile", scrape_config):
-        with open(
-            path.abspath(scrape_config["ScrapingConfigurationFile"])
-        ) as config_fd:
-            value_py = yaml.load(config_fd.read(), Loader=Loader)
+        value_py = load_yaml_file(scrape_config["ScrapingConfigurationFile"])
     else:
         value_py = {
             "global": {
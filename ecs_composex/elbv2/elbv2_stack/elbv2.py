@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from ecs_composex.mods_manager import XResourceModule
     from ecs_composex.common.settings import ComposeXSettings
 
+from copy import deepcopy
+
 from compose_x_common.compose_x_common import keyisset, keypresent, set_else_none
 from troposphere import AWS_NO_VALUE, AWS_STACK_NAME, GetAtt, Ref, Select, Sub, Tags
 from troposphere.ec2 import EIP, SecurityGroup
@@ -70,6 +72,8 @@ class Elbv2(NetworkXResource):
         self.listeners: list[ComposeListener] = []
         self.target_groups: list[MergedTargetGroup] = []
         super().__init__(name, definition, module, settings)
+        # set_listeners removes the targets not matching a service from the listeners definition
+        self.definition["Listeners"] = deepcopy(self.definition["Listeners"])
         self.validate_services()
         self.sort_props()
         self.module_name = MOD_KEY
@@ -9,6 +9,9 @@ import json
 
 from importlib_resources import files as pkg_files
 
+PKG_ROOT = pkg_files("ecs_composex")
+SAM_POLICIES_PATH = str(PKG_ROOT.joinpath("iam/sam_policies.json"))
+
 
 def import_and_cleanse_sam_policies():
     """
@@ -17,8 +20,7 @@ def import_and_cleanse_sam_policies():
     :return: The policies
     :rtype: dict
     """
-    template_path = str(pkg_files("ecs_composex").joinpath("iam/sam_policies.json"))
-    with open(template_path) as policies_fd:
+    with open(SAM_POLICIES_PATH) as policies_fd:
         policies_orig = json.loads(policies_fd.read())["Templates"]
     import_policies = {}
 
@@ -42,11 +44,7 @@ def get_access_types(module_name: str, perms_path: str = None) -> dict:
     """
     sam_policies = import_and_cleanse_sam_policies()
     if not perms_path:
-        source = str(
-            pkg_files("ecs_composex").joinpath(
-                f"{module_name}/{module_name}_perms.json"
-            )
-        )
+        source = str(PKG_ROOT.joinpath(f"{module_name}/{module_name}_perms.json"))
     else:
         source = perms_path
     try:
@@ -34,10 +34,16 @@ if TYPE_CHECKING:
     )
 
 import re
+from codecs import BOM_UTF8
 from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache
 from importlib import import_module
-from json import loads
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 from compose_x_common.compose_x_common import keyisset, set_else_none
 
@@ -47,6 +53,22 @@ from ecs_composex.common.logging import LOG
 from ecs_composex.iam.import_sam_policies import import_and_cleanse_sam_policies
 
 
+@lru_cache(maxsize=None)
+def load_json_schema(file_path: str) -> dict:
+    """
+    Reads and parses a module JSON schema file, once per file path.
+    The schema returned is shared between modules and must not be modified.
+
+    :param str file_path:
+    :raises OSError: if the file cannot be read
+    """
+    with open(file_path, "rb") as json_schema_fd:
+        content = json_schema_fd.read()
+    if content.startswith(BOM_UTF8):
+        content = content[len(BOM_UTF8) :]
+    return loads(content)
+
+
 class XResourceModule:
     def __init__(
         self,
@@ -233,8 +255,7 @@ class XResourceModule:
     def import_json_schema(self):
         json_schema_file_path = self._path.joinpath(f"{self.res_key}.spec.json")
         try:
-            with open(json_schema_file_path, encoding="utf-8-sig") as json_schema_fd:
-                self._json_schema = loads(json_schema_fd.read())
+            self._json_schema = load_json_schema(str(json_schema_file_path))
         except OSError:
             LOG.warning(
                 f"{self.res_key} - JSON Schema not found for validation. Render may contain errors."
@@ -19,7 +19,6 @@ if TYPE_CHECKING:
     from ecs_composex.common.stacks import ComposeXStack
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws import get_account_id
 from compose_x_common.aws.rds import RDS_DB_ID_CLUSTER_ARN_RE
 from compose_x_common.compose_x_common import keyisset, keypresent, set_else_none
 from troposphere import FindInMap, GetAtt, Ref, Sub
@@ -28,7 +27,10 @@ from troposphere.ecs import Environment
 from troposphere.ecs import Secret as EcsSecret
 from troposphere.iam import PolicyType
 
-from ecs_composex.common.aws import find_aws_resource_arn_from_tags_api
+from ecs_composex.common.aws import (
+    find_aws_resource_arn_from_tags_api,
+    get_session_account_id,
+)
 from ecs_composex.common.cfn_params import Parameter
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.troposphere_tools import (
@@ -164,7 +166,7 @@ def lookup_rds_resource(
             " - Failed to find the AWS Resource with given tags"
         )
     props = {}
-    _account_id = get_account_id(rds_resource.lookup_session)
+    _account_id = get_session_account_id(rds_resource.lookup_session)
     if _account_id == account_id and rds_resource.cloud_control_attributes_mapping:
         props = rds_resource.cloud_control_attributes_mapping_lookup(
             cfn_resource_type, resource_id
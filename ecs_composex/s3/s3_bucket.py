@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
-from compose_x_common.aws import get_account_id
 from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import GetAtt, Ref
 
-from ecs_composex.common.aws import find_aws_resource_arn_from_tags_api
+from ecs_composex.common.aws import (
+    find_aws_resource_arn_from_tags_api,
+    get_session_account_id,
+)
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.settings import ComposeXSettings
 from ecs_composex.common.stacks import ComposeXStack
@@ -144,7 +146,9 @@ class Bucket(ApiXResource):
                 )
         if not props:
             props = self.native_attributes_mapping_lookup(
-                get_account_id(self.lookup_session), resource_id, native_lookup_function
+                get_session_account_id(self.lookup_session),
+                resource_id,
+                native_lookup_function,
             )
         self.lookup_properties = props
         self.generate_cfn_mappings_from_lookup_properties()
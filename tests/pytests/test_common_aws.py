@@ -5,6 +5,7 @@
 from pytest import fixture, raises
 
 from ecs_composex.common.aws import (
+    get_session_account_id,
     handle_multi_results,
     handle_search_results,
     validate_search_input,
@@ -61,3 +62,21 @@ def test_validate_search_input_exceptions(res_types):
         validate_search_input(res_types, "abcd")
     with raises(KeyError):
         validate_search_input(res_types, 1)
+
+
+def test_session_account_id_cached():
+    class StsClient:
+        calls = 0
+
+        def get_caller_identity(self):
+            StsClient.calls += 1
+            return {"Account": "012345678912"}
+
+    class FakeSession:
+        def client(self, service_name):
+            return StsClient()
+
+    session = FakeSession()
+    assert get_session_account_id(session) == "012345678912"
+    assert get_session_account_id(session) == "012345678912"
+    assert StsClient.calls == 1
@@ -4,6 +4,8 @@
 
 from pytest import raises
 
+from ecs_composex.common import clpow2, nxtpow2
+from ecs_composex.compose.x_resources import get_env_var_name
 from ecs_composex.ingress_settings import generate_security_group_props
 
 
@@ -12,3 +14,29 @@ def test_cidr_validation():
     with raises(ValueError):
         a = generate_security_group_props({"IPv4": "1.1.1.256/32"})
         a = generate_security_group_props({"IPv4": "1.1.1.1/33"})
+
+
+def test_powers_of_two():
+    assert [clpow2(x) for x in (1, 256, 360, 370, 512, 1024, 3072)] == [
+        1,
+        256,
+        256,
+        512,
+        512,
+        1024,
+        4096,
+    ]
+    assert [nxtpow2(x) for x in (1, 256, 257, 1000, 1024, 2**29)] == [
+        1,
+        256,
+        512,
+        1024,
+        1024,
+        2**29,
+    ]
+
+
+def test_env_var_name():
+    assert get_env_var_name("my-queue.fifo") == "MY_QUEUEFIFO"
+    assert get_env_var_name("table_01") == "TABLE_01"
+    assert get_env_var_name("straße-é") == "STRASSE_"
@@ -0,0 +1,90 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import json
+
+from ecs_composex.common.cfn_params import ROOT_STACK_NAME, Parameter
+from ecs_composex.common.troposphere_tools import (
+    add_defaults,
+    add_parameters,
+    add_update_mapping,
+    build_template,
+)
+
+
+def test_parameters_groups():
+    """
+    Parameters of the same group end up in the same ParameterGroup, only once.
+    """
+    template = build_template("test")
+    params = [
+        Parameter("ParamA", group_label="GroupA", Type="String"),
+        Parameter("ParamB", group_label="GroupB", Type="String"),
+        Parameter("ParamC", group_label="GroupA", Type="String"),
+    ]
+    add_parameters(template, params)
+    add_parameters(template, params)
+    metadata = json.loads(template.to_json())["Metadata"]
+    groups = metadata["AWS::CloudFormation::Interface"]["ParameterGroups"]
+    assert groups == [
+        {"Label": {"default": "GroupA"}, "Parameters": ["ParamA", "ParamC"]},
+        {"Label": {"default": "GroupB"}, "Parameters": ["ParamB"]},
+    ]
+
+
+def test_parameters_groups_existing_metadata():
+    """
+    Groups already present in the template metadata are re-used.
+    """
+    template = build_template("test")
+    template.metadata["AWS::CloudFormation::Interface"] = {
+        "ParameterGroups": [
+            {"Label": {"default": "GroupA"}, "Parameters": ["ParamA"]},
+        ]
+    }
+    add_parameters(
+        template,
+        [
+            Parameter("ParamA", group_label="GroupA", Type="String"),
+            Parameter("ParamB", group_label="GroupA", Type="String"),
+        ],
+    )
+    groups = template.metadata["AWS::CloudFormation::Interface"]["ParameterGroups"]
+    assert groups == [
+        {"Label": {"default": "GroupA"}, "Parameters": ["ParamA", "ParamB"]},
+    ]
+
+
+def test_add_update_mapping():
+    template = build_template("test")
+    add_update_mapping(template, "Map", {"KeyA": {"A": 1}})
+    add_update_mapping(template, "Map", {"KeyB": {"B": 1}})
+    add_update_mapping(template, "Map", {"A2": 2}, mapping_subkey="KeyA")
+    add_update_mapping(template, "Map", {"C": 3}, mapping_subkey="KeyC")
+    assert template.mappings["Map"] == {
+        "KeyA": {"A": 1, "A2": 2},
+        "KeyB": {"B": 1},
+        "KeyC": {"C": 3},
+    }
+
+
+def test_parameters_labels():
+    template = build_template("test")
+    add_parameters(
+        template,
+        [
+            Parameter("ParamA", label="Param A", Type="String"),
+            Parameter("ParamB", label="Param B", Type="String"),
+        ],
+    )
+    labels = template.metadata["AWS::CloudFormation::Interface"]["ParameterLabels"]
+    assert labels == {
+        "ParamA": {"default": "Param A"},
+        "ParamB": {"default": "Param B"},
+    }
+
+
+def test_add_defaults_twice():
+    template = build_template("test")
+    add_defaults(template)
+    assert ROOT_STACK_NAME.title in template.parameters